@@ -0,0 +1,107 @@
+"""Cold-start import-time gate for the scraper entry points.
+
+Imports each scraper in a fresh interpreter under ``python -X importtime``
+and fails if the import pulls in a dependency that should be lazy
+(pandas, geopy, bs4) or takes longer than the budget.
+
+The eager-import check only means something when those packages are
+installed, so a missing one fails the gate unless ``--allow-missing`` is
+given, which downgrades it to a warning.
+
+Both supported invocations are checked: running the script directly
+(``python scrapers/scrape_nhai.py``, which puts ``scrapers/`` on sys.path)
+and ``python -m scrapers.scrape_nhai`` from the repository root.
+
+Usage:
+    python scrapers/bench_importtime.py [--budget-ms 250] [--allow-missing]
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+
+ENTRY_POINTS = ['scrape_courts', 'scrape_gazette', 'scrape_news', 'scrape_nhai']
+
+# Only needed on specific code paths; must never load at import time.
+LAZY_MODULES = ['pandas', 'geopy', 'bs4']
+
+SCRAPERS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRAPERS_DIR)
+
+# (label, working directory, module name prefix) for each supported layout.
+LAYOUTS = [
+    ('script', SCRAPERS_DIR, ''),
+    ('-m', REPO_ROOT, 'scrapers.'),
+]
+
+
+def measure(module, cwd):
+    # Each line of -X importtime output looks like:
+    #   import time:  self [us] | cumulative | imported package
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.split('Traceback', 1)[-1]
+        raise RuntimeError(f"Importing {module} failed:\nTraceback{tail}")
+
+    total_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].strip()
+        loaded.add(name.split('.')[0])
+        if name == module:
+            total_us = int(parts[1])
+    if total_us is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return total_us, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=250,
+                        help="max cumulative import time per entry point")
+    parser.add_argument('--allow-missing', action='store_true',
+                        help="warn instead of failing when a lazy module is not installed")
+    args = parser.parse_args()
+
+    failures = []
+    for m in LAZY_MODULES:
+        if importlib.util.find_spec(m) is None:
+            message = f"{m} is not installed, so its eager-import check cannot fail"
+            if args.allow_missing:
+                print(f"WARNING: {message}")
+            else:
+                failures.append(message)
+
+    for name in ENTRY_POINTS:
+        for label, cwd, prefix in LAYOUTS:
+            module = prefix + name
+            try:
+                total_us, loaded = measure(module, cwd)
+            except RuntimeError as e:
+                failures.append(str(e))
+                continue
+            eager = [m for m in LAZY_MODULES if m in loaded]
+            print(f"{name:<16} {label:<7} {total_us / 1000:8.1f} ms")
+            if eager:
+                failures.append(f"{module} imports {', '.join(eager)} at module load")
+            if total_us / 1000 > args.budget_ms:
+                failures.append(f"{module} took {total_us / 1000:.1f} ms (budget {args.budget_ms} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
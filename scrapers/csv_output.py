@@ -0,0 +1,46 @@
+import csv
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _float_columns(rows, fieldnames):
+    # pandas gives each column a single dtype: a purely numeric column that
+    # holds a float, or has missing values, is float64, so its ints print as
+    # 1.0. Columns that mix in strings or other objects keep str() per value.
+    float_columns = set()
+    for name in fieldnames:
+        values = [row.get(name) for row in rows]
+        present = [v for v in values if v is not None]
+        if not present or not all(_is_int(v) or isinstance(v, float) for v in present):
+            continue
+        if len(present) < len(values) or any(isinstance(v, float) for v in present):
+            float_columns.add(name)
+    return float_columns
+
+
+def write_csv(rows, path):
+    # Plain csv replacement for pd.DataFrame(rows).to_csv(path, index=False),
+    # so the scrapers don't pay pandas' import cost just to write one file.
+    # Columns follow first appearance across all rows, like the DataFrame did.
+    fieldnames = []
+    for row in rows:
+        for key in row:
+            if key not in fieldnames:
+                fieldnames.append(key)
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if not fieldnames:
+            # An empty DataFrame still writes a single empty header cell.
+            f.write('""\n')
+            return
+
+        float_columns = _float_columns(rows, fieldnames)
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({
+                name: float(value) if name in float_columns and _is_int(value) else value
+                for name, value in row.items()
+            })
@@ -1,10 +1,13 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime
 import time
 import os
 
+try:
+    from csv_output import write_csv
+except ImportError:  # run as `python -m scrapers.<module>` from the repo root
+    from scrapers.csv_output import write_csv
+
 class CourtScraper:
     def __init__(self):
         self.session = requests.Session()
@@ -57,7 +60,6 @@ if __name__ == "__main__":
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    df = pd.DataFrame(cases)
     output_file = os.path.join(output_dir, 'court_judgments.csv')
-    df.to_csv(output_file, index=False)
+    write_csv(cases, output_file)
     print(f"Scraped {len(cases)} cases. Saved to {output_file}")
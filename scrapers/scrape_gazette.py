@@ -1,11 +1,14 @@
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime, timedelta
 import os
 import time
 
+try:
+    from csv_output import write_csv
+except ImportError:  # run as `python -m scrapers.<module>` from the repo root
+    from scrapers.csv_output import write_csv
+
 class GazetteScraper:
     def __init__(self):
         self.base_url = "https://egazette.gov.in"
@@ -22,6 +25,8 @@ class GazetteScraper:
         # This is a simplified requests-based attempt which might need enhancement.
         # For now, we will simulate the search if direct request fails, or return empty.
         
+        from bs4 import BeautifulSoup
+
         try:
             # 1. Get the page to fetch ViewState
             response = self.session.get(self.search_url, timeout=30, verify=False)
@@ -67,8 +72,7 @@ class GazetteScraper:
             print("No notifications to save.")
             return
 
-        df = pd.DataFrame(notifications)
-        df.to_csv('gazette_notifications.csv', index=False)
+        write_csv(notifications, 'gazette_notifications.csv')
         print(f"Saved {len(notifications)} notifications to gazette_notifications.csv")
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime
 import os
 
+try:
+    from csv_output import write_csv
+except ImportError:  # run as `python -m scrapers.<module>` from the repo root
+    from scrapers.csv_output import write_csv
+
 class NewsScraper:
     def __init__(self):
         self.session = requests.Session()
@@ -48,6 +51,7 @@ class NewsScraper:
         try:
             response = self.session.get(url, timeout=30)
             if response.status_code == 200:
+                from bs4 import BeautifulSoup
                 soup = BeautifulSoup(response.content, 'html.parser')
                 # TOI structure changes, but finding headlines is usually standard
                 # Look for article list items
@@ -65,7 +69,6 @@ if __name__ == "__main__":
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    df = pd.DataFrame(pib_news)
     output_file = os.path.join(output_dir, 'news_infrastructure.csv')
-    df.to_csv(output_file, index=False)
+    write_csv(pib_news, output_file)
     print(f"Scraped {len(pib_news)} news items. Saved to {output_file}")
@@ -1,13 +1,14 @@
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime
 import json
 import os
 import time
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
+
+try:
+    from csv_output import write_csv
+except ImportError:  # run as `python -m scrapers.<module>` from the repo root
+    from scrapers.csv_output import write_csv
 
 class NHAIScraper:
     def __init__(self):
@@ -16,9 +17,20 @@ class NHAIScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.geolocator = Nominatim(user_agent="laras_scraper_v1")
+        # geopy is only needed when live rows are geocoded, so it is
+        # imported on first use rather than at module load.
+        self._geolocator = None
+
+    @property
+    def geolocator(self):
+        if self._geolocator is None:
+            from geopy.geocoders import Nominatim
+            self._geolocator = Nominatim(user_agent="laras_scraper_v1")
+        return self._geolocator
 
     def get_coordinates(self, location_name):
+        from geopy.exc import GeocoderTimedOut
+
         try:
             query = f"{location_name}, India"
             location = self.geolocator.geocode(query, timeout=10)
@@ -38,6 +50,8 @@ class NHAIScraper:
             print(f"Error fetching {url}: {e}")
             return []
 
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(response.content, 'html.parser')
         projects = []
         
@@ -269,12 +283,12 @@ class NHAIScraper:
             
             # Helper to escape strings
             def esc(val):
-                return f"'{val.replace("'", "''")}'" if val else "NULL"
+                return "'" + val.replace("'", "''") + "'" if val else "NULL"
             
             # Helper for arrays
             def arr(val_list):
                 if not val_list: return "NULL"
-                quoted = [f"'{x.replace("'", "''")}'" for x in val_list]
+                quoted = ["'" + x.replace("'", "''") + "'" for x in val_list]
                 return f"ARRAY[{','.join(quoted)}]"
             
             val = f"({esc(p['project_name'])}, {esc(p['project_code'])}, {esc(p['project_type'])}, {esc(p['state'])}, {arr(p.get('districts_covered'))}, {arr(p.get('cities_affected'))}, {esc(p['project_phase'])}, {p.get('budget_crores', 0)}, {p.get('total_length_km', 0)}, {esc(p.get('notification_date'))}, {esc(p.get('expected_completion_date'))}, {esc(p.get('implementing_agency'))}, {geojson}, 'NHAI Scraper')"
@@ -298,8 +312,7 @@ if __name__ == "__main__":
     if projects:
         # Save to CSV
         try:
-            df = pd.DataFrame(projects)
-            df.to_csv('nhai_projects.csv', index=False)
+            write_csv(projects, 'nhai_projects.csv')
             print("Saved to nhai_projects.csv")
         except Exception as e:
             print(f"Error saving CSV: {e}")
@@ -0,0 +1,55 @@
+from csv_output import write_csv
+
+
+def _write(tmp_path, rows):
+    path = tmp_path / 'out.csv'
+    write_csv(rows, path)
+    with open(path, newline='', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_columns_follow_first_appearance(tmp_path):
+    rows = [{'b': 'x', 'a': 'y'}, {'a': 'z', 'c': 'w'}]
+    assert _write(tmp_path, rows) == 'b,a,c\nx,y,\n,z,w\n'
+
+
+def test_quotes_commas_and_quotes(tmp_path):
+    rows = [{'title': 'S.O. 123(E), "Section 3A"'}]
+    assert _write(tmp_path, rows) == 'title\n"S.O. 123(E), ""Section 3A"""\n'
+
+
+def test_lists_and_dicts_use_repr(tmp_path):
+    rows = [{'districts': ['Mumbai City', 'Raigad'], 'geo': {'type': 'Point'}, 'one': ['Reasi']}]
+    assert _write(tmp_path, rows) == (
+        'districts,geo,one\n'
+        '"[\'Mumbai City\', \'Raigad\']",{\'type\': \'Point\'},[\'Reasi\']\n'
+    )
+
+
+def test_none_is_empty(tmp_path):
+    rows = [{'date': None, 'name': 'a'}, {'date': '2024-01-01', 'name': None}]
+    assert _write(tmp_path, rows) == 'date,name\n,a\n2024-01-01,\n'
+
+
+def test_empty_rows(tmp_path):
+    assert _write(tmp_path, []) == '""\n'
+
+
+def test_int_column_stays_int(tmp_path):
+    rows = [{'budget': 17843}, {'budget': 0}]
+    assert _write(tmp_path, rows) == 'budget\n17843\n0\n'
+
+
+def test_mixed_int_float_column_is_float(tmp_path):
+    rows = [{'length': 21.8}, {'length': 0}, {'length': 1350}]
+    assert _write(tmp_path, rows) == 'length\n21.8\n0.0\n1350.0\n'
+
+
+def test_int_column_with_missing_values_is_float(tmp_path):
+    rows = [{'a': 1}, {'a': None}, {'b': 'x'}]
+    assert _write(tmp_path, rows) == 'a,b\n1.0,\n,\n,x\n'
+
+
+def test_object_column_keeps_ints(tmp_path):
+    rows = [{'code': 1}, {'code': 'NHAI-1'}, {'code': 2.5}]
+    assert _write(tmp_path, rows) == 'code\n1\nNHAI-1\n2.5\n'